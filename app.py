@@ -1,170 +1,356 @@
 import streamlit as st
-import requests
+import httpx
 from datetime import datetime, timedelta
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import json
+import io
+import orjson
 import os
+import time
 
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Function to load the environment and read the GitHub token once per process
+# instead of re-parsing the .env file on every Streamlit rerun
+@st.cache_resource
+def get_token():
+    load_dotenv()
+    return os.getenv('TOKEN')
 
-# Get the GitHub token from the environment
-token = os.getenv('TOKEN')
+token = get_token()
 
 if not token:
     st.error("GitHub token is not set. Please check your .env file.")
 
-# Define headers for GitHub API requests
-headers = {
-    'Authorization': f'bearer {token}'
-}
+# Build a shared HTTP/2 client so repeated API calls reuse one TLS connection
+# and concurrent requests multiplex over it instead of opening one socket
+# each. Cached as a resource so it survives Streamlit reruns.
+@st.cache_resource
+def get_session():
+    return httpx.Client(
+        # Advertise brotli alongside gzip/deflate; JSON responses compress
+        # 5-10x, which dominates transfer time on slow links
+        headers={'Authorization': f'bearer {token}', 'Accept-Encoding': 'gzip, deflate, br'},
+        timeout=10.0,
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=3,  # retry failed connection attempts at the transport level
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+    )
+
+SESSION = get_session()
 
 CAMPAIGN_FILE = 'campaign_data.json'
 DEV_CAMPAIGN_FILE = 'dev_campaign_data.json'
 
-# Function to get repository details and issues
-def get_repo_details_and_issues(owner, repo):
-    url = "https://api.github.com/graphql"
-    query_template = f"""
-    {{
-      repository(owner: "{owner}", name: "{repo}") {{
+# Field selection shared by the single-repo and batched repository queries
+REPO_FIELDS = """
         stargazerCount
         forkCount
-        languages(first: 10) {{
-          edges {{
-            size
-            node {{
+        languages(first: 10) {
+          edges {
+            node {
               name
-            }}
-          }}
-        }}
-        issues(last: 100, states: CLOSED) {{
-          edges {{
-            node {{
+            }
+          }
+        }
+        issues(last: 10, states: CLOSED) {
+          edges {
+            node {
               createdAt
               closedAt
-            }}
-          }}
-        }}
-        defaultBranchRef {{
-          target {{
-            ... on Commit {{
-              history(first: 60) {{
-                edges {{
-                  node {{
+            }
+          }
+        }
+        recentIssues: issues(states: CLOSED, filterBy: {since: $issuesSince}) {
+          totalCount
+        }
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              latestCommit: history(first: 1) {
+                edges {
+                  node {
                     committedDate
                     message
                     url
-                  }}
-                }}
-              }}
-            }}
-          }}
-        }}
-        collaborators(first: 10) {{
-          edges {{
-            node {{
+                  }
+                }
+              }
+              recentCommits: history(since: $since) {
+                totalCount
+              }
+            }
+          }
+        }
+        collaborators(first: 10) {
+          edges {
+            node {
               login
               url
-            }}
-          }}
-        }}
-      }}
+            }
+          }
+        }
+"""
+
+# Single-repo query, parameterized so the (constant) query text is built once
+# and only the variables change per call; GitHub can also reuse its parsed
+# form server-side, and owner/repo names need no quoting.
+REPO_QUERY = f"""
+    query($owner: String!, $repo: String!, $since: GitTimestamp!, $issuesSince: DateTime!) {{
+      repository(owner: $owner, name: $repo) {{{REPO_FIELDS}}}
     }}
-    """
-    response = requests.post(url, headers=headers, json={"query": query_template})
+"""
+
+# Function to format the 60-day cutoff the way GitHub's API expects it
+def sixty_days_ago_iso():
+    return (datetime.utcnow() - timedelta(days=60)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+# Function to send a request and retry transient failures. A 429, or a 403
+# with the rate-limit quota exhausted, waits for Retry-After (or until
+# X-RateLimit-Reset); gateway errors (502/503/504) back off exponentially.
+def request_with_backoff(method, url, attempts=5, **kwargs):
+    for attempt in range(attempts):
+        response = SESSION.request(method, url, **kwargs)
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403 and response.headers.get('X-RateLimit-Remaining') == '0'
+        )
+        transient = response.status_code in (502, 503, 504)
+        if not (rate_limited or transient) or attempt == attempts - 1:
+            return response
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            wait = max(1, int(retry_after))
+        elif rate_limited:
+            wait = max(1, int(response.headers.get('X-RateLimit-Reset', '0')) - int(time.time()))
+        else:
+            wait = 2 ** attempt
+        time.sleep(min(wait, 120))
+    return response
+
+# Function to get repository details and issues. Cached so Streamlit reruns
+# (button clicks, tab switches) within the TTL reuse the parsed response
+# instead of re-hitting the API and burning rate limit.
+@st.cache_data(ttl=1800, show_spinner=False)
+def get_repo_details_and_issues(owner, repo):
+    url = "https://api.github.com/graphql"
+    # Send the last known ETag; a 304 costs no rate-limit points and carries
+    # no body, so the stashed response is reused as-is
+    etag_key = f'etag:{owner}/{repo}'
+    cached = st.session_state.get(etag_key)
+    conditional_headers = {'If-None-Match': cached[0]} if cached else {}
+    since = sixty_days_ago_iso()
+    response = request_with_backoff(
+        'POST', url,
+        json={"query": REPO_QUERY, "variables": {"owner": owner, "repo": repo, "since": since, "issuesSince": since}},
+        headers=conditional_headers
+    )
+    if cached and response.status_code == 304:
+        return cached[1], None
     if response.status_code != 200:
         return None, f"Failed to fetch data: {response.status_code}"
-    response_data = response.json()
+    response_data = orjson.loads(response.content)
     if 'errors' in response_data:
         # Handle 'FORBIDDEN' error for collaborators
         if any(error['type'] == 'FORBIDDEN' for error in response_data['errors']):
             response_data['data']['repository']['collaborators'] = {'edges': []}
         else:
             return None, f"Errors in response: {response_data['errors']}"
+    etag = response.headers.get('ETag')
+    if etag:
+        st.session_state[etag_key] = (etag, response_data)
     return response_data, None
 
+# Query for a developer's repositories with their 60-day commit counts nested
+# in, so the whole Developer Search view costs a single roundtrip instead of
+# one REST listing plus one query per repo
+DEVELOPER_QUERY = """
+    query($login: String!, $since: GitTimestamp!) {
+      user(login: $login) {
+        repositories(first: 100, ownerAffiliations: OWNER) {
+          nodes {
+            name
+            url
+            createdAt
+            defaultBranchRef {
+              target {
+                ... on Commit {
+                  history(since: $since) {
+                    totalCount
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
 # Function to get developer details
+@st.cache_data(ttl=1800, show_spinner=False)
 def get_developer_details(username):
-    url = f"https://api.github.com/users/{username}/repos"
-    response = requests.get(url, headers=headers)
+    url = "https://api.github.com/graphql"
+    since = sixty_days_ago_iso()
+    response = request_with_backoff('POST', url, json={"query": DEVELOPER_QUERY, "variables": {"login": username, "since": since}})
     if response.status_code != 200:
         return None, f"Failed to fetch data: {response.status_code}"
-    return response.json(), None
+    response_data = orjson.loads(response.content)
+    user = (response_data.get('data') or {}).get('user')
+    if user is None:
+        if 'errors' in response_data:
+            return None, f"Errors in response: {response_data['errors']}"
+        return None, f"Developer {username} not found."
+    return user['repositories']['nodes'], None
+
+# Function to parse GitHub's ISO-8601 timestamps. fromisoformat is C-level and
+# much faster than strptime, which re-interprets its format string every call.
+def parse_github_timestamp(timestamp):
+    return datetime.fromisoformat(timestamp[:-1])  # strip the trailing 'Z'
 
 # Function to calculate average issue resolution time
 def calculate_average_resolution_time(issues):
-    total_resolution_time = 0
-    resolved_issue_count = 0
-
-    for issue in issues[:10]:  # Only consider the last 10 issues
-        created_at = datetime.strptime(issue['createdAt'], '%Y-%m-%dT%H:%M:%SZ')
-        closed_at = datetime.strptime(issue['closedAt'], '%Y-%m-%dT%H:%M:%SZ')
-        resolution_time = closed_at - created_at
-        total_resolution_time += resolution_time.total_seconds()
-        resolved_issue_count += 1
-
-    if resolved_issue_count == 0:
+    issues = issues[:10]  # Only consider the last 10 issues
+    if not issues:
         return 0
 
-    average_resolution_time = total_resolution_time / resolved_issue_count
+    df = pd.DataFrame(issues)
+    created = pd.to_datetime(df['createdAt'], format='%Y-%m-%dT%H:%M:%SZ', utc=True)
+    closed = pd.to_datetime(df['closedAt'], format='%Y-%m-%dT%H:%M:%SZ', utc=True)
+    average_resolution_time = (closed - created).dt.total_seconds().mean()
     return average_resolution_time / 3600  # return in hours
 
-# Function to count issues resolved in the last 60 days
-def count_issues_resolved_last_60_days(issues):
-    resolved_count = 0
-    sixty_days_ago = datetime.now() - timedelta(days=60)
-
-    for issue in issues:
-        closed_at = datetime.strptime(issue['closedAt'], '%Y-%m-%dT%H:%M:%SZ')
-        if closed_at >= sixty_days_ago:
-            resolved_count += 1
-
-    return resolved_count
-
-# Function to count commits in the last 60 days
-def count_commits_last_60_days(commits):
-    commit_count = 0
-    sixty_days_ago = datetime.now() - timedelta(days=60)
-
-    for commit in commits:
-        committed_date = datetime.strptime(commit['node']['committedDate'], '%Y-%m-%dT%H:%M:%SZ')
-        if committed_date >= sixty_days_ago:
-            commit_count += 1
-
-    return commit_count
-
-# Function to save campaign data to a JSON file
+# Function to fetch many repositories in one GraphQL request using aliases.
+# GitHub counts a batched query as a single API call, so N repos cost one
+# roundtrip and one rate-limit point per chunk of 50 instead of N.
+def get_many_repos(pairs):
+    url = "https://api.github.com/graphql"
+    since = sixty_days_ago_iso()
+    results = {}
+    for start in range(0, len(pairs), 50):
+        chunk = pairs[start:start + 50]
+        # Aliased selections can't take their names from variables, so the
+        # owner/repo strings are JSON-escaped before interpolation
+        blocks = [
+            f'r{i}: repository(owner: {orjson.dumps(owner).decode()}, name: {orjson.dumps(repo).decode()}) {{{REPO_FIELDS}}}'
+            for i, (owner, repo) in enumerate(chunk)
+        ]
+        query = "query($since: GitTimestamp!, $issuesSince: DateTime!) {\n" + "\n".join(blocks) + "\n}"
+        response = request_with_backoff('POST', url, json={"query": query, "variables": {"since": since, "issuesSince": since}})
+        if response.status_code != 200:
+            return None, f"Failed to fetch data: {response.status_code}"
+        response_data = orjson.loads(response.content)
+        if 'errors' in response_data and not response_data.get('data'):
+            return None, f"Errors in response: {response_data['errors']}"
+        for i, (owner, repo) in enumerate(chunk):
+            node = (response_data.get('data') or {}).get(f'r{i}')
+            # Handle 'FORBIDDEN' error for collaborators: listing them needs
+            # push access, so GitHub nulls the field for repos we don't own
+            if node and node.get('collaborators') is None:
+                node['collaborators'] = {'edges': []}
+            results[(owner, repo)] = node
+    return results, None
+
+# Function to build a campaign entry from a repository node
+def build_campaign_entry(owner, repo, repository):
+    issues = [edge['node'] for edge in repository['issues']['edges']]
+    average_time = calculate_average_resolution_time(issues)
+    if average_time > 24:
+        average_time_formatted = f"{average_time / 24:.2f} days"
+    else:
+        average_time_formatted = f"{average_time:.2f} hours"
+    target = repository['defaultBranchRef']['target'] if repository['defaultBranchRef'] else None
+    latest_commit_edges = target['latestCommit']['edges'] if target else []
+    latest_commit = latest_commit_edges[0]['node'] if latest_commit_edges else None
+    return {
+        "repo_name": repo,
+        "owner": owner,
+        "stars": repository['stargazerCount'],
+        "forks": repository['forkCount'],
+        # Filter out "Hack" language
+        "languages": ', '.join(name for edge in repository['languages']['edges'] if (name := edge['node']['name']) != "Hack"),
+        "average_issue_resolution_time": average_time_formatted,
+        "latest_commit_date": parse_github_timestamp(latest_commit['committedDate']).date().isoformat() if latest_commit else None,
+        "contributors": ', '.join(edge['node']['login'] for edge in repository['collaborators']['edges']),
+        "issues_solved_last_60_days": repository['recentIssues']['totalCount'],
+        "commits_last_60_days": target['recentCommits']['totalCount'] if target else 0
+    }
+
+# Function to save campaign data to a JSON file. The data is written to a
+# temp file, synced, and swapped in with os.replace so a crash mid-write
+# leaves the previous campaign file intact instead of a truncated one.
 def save_campaign(campaign_data):
-    with open(CAMPAIGN_FILE, 'w') as f:
-        json.dump(campaign_data, f)
+    tmp_file = CAMPAIGN_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(campaign_data, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, CAMPAIGN_FILE)
 
 # Function to load campaign data from a JSON file
 def load_campaign():
     if os.path.exists(CAMPAIGN_FILE):
-        with open(CAMPAIGN_FILE, 'r') as f:
-            return json.load(f)
+        with open(CAMPAIGN_FILE, 'rb') as f:
+            return orjson.loads(f.read())
     return []
 
-# Function to save developer campaign data to a JSON file
+# Function to save developer campaign data to a JSON file, atomically as above
 def save_dev_campaign(dev_campaign_data):
-    with open(DEV_CAMPAIGN_FILE, 'w') as f:
-        json.dump(dev_campaign_data, f)
+    tmp_file = DEV_CAMPAIGN_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(dev_campaign_data, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, DEV_CAMPAIGN_FILE)
 
 # Function to load developer campaign data from a JSON file
 def load_dev_campaign():
     if os.path.exists(DEV_CAMPAIGN_FILE):
-        with open(DEV_CAMPAIGN_FILE, 'r') as f:
-            return json.load(f)
+        with open(DEV_CAMPAIGN_FILE, 'rb') as f:
+            return orjson.loads(f.read())
     return []
 
-# Load the CSV data for visualizations
+# Function to serialize campaign rows to CSV bytes once per distinct
+# contents. Rows arrive as a tuple-of-item-tuples snapshot so they hash as a
+# cache key; without this the serialization reran on every tab4 rerun even
+# when the download button was never clicked.
+@st.cache_data
+def campaign_csv_bytes(rows):
+    csv_buffer = io.BytesIO()
+    pd.DataFrame([dict(row) for row in rows]).to_csv(csv_buffer, index=False, encoding='utf-8')
+    return csv_buffer.getvalue()
+
+# Function to load the visualization CSV once per process. Only the columns
+# the charts use are read, with compact dtypes; without the cache the full
+# parse reruns on every button click and tab switch.
+@st.cache_data
+def load_repos_csv(path):
+    return pd.read_csv(
+        path,
+        usecols=['repo_name', 'languages', 'stars_count', 'forks_count', 'resolution_time_hours'],
+        dtype={'stars_count': 'int32', 'forks_count': 'int32', 'resolution_time_hours': 'float32'}
+    )
+
+# Function to explode the comma-separated language lists into one Series.
+# Categorical dtype keeps the repeated language names as integer codes, so the
+# value counts are cheap, and the cache avoids redoing the split per rerun.
+@st.cache_data
+def get_language_series(df):
+    return df['languages'].str.split(', ').explode().dropna().astype('category')
+
+# Function to count language occurrences once per CSV load; reruns get the
+# memoized Series back instead of recounting
+@st.cache_data
+def get_language_counts(df):
+    return get_language_series(df).value_counts()
+
+# Function to take the top-n rows by a column. nlargest/nsmallest is a partial
+# top-k selection, and the cache means rerenders skip even that.
+@st.cache_data
+def top_n(df, col, n=10, ascending=False):
+    return df.nsmallest(n, col) if ascending else df.nlargest(n, col)
+
 csv_file_path = r'topthousandrepos.csv'
-df = pd.read_csv(csv_file_path)
 
 # Initialize the session state for campaign repositories and developers
 if 'campaign_repos' not in st.session_state:
@@ -173,19 +359,23 @@ if 'campaign_repos' not in st.session_state:
 if 'dev_campaign' not in st.session_state:
     st.session_state.dev_campaign = load_dev_campaign()
 
-campaign_repos = st.session_state.campaign_repos
-dev_campaign = st.session_state.dev_campaign
-
 # Create tabs
 tab1, tab2, tab3, tab4, tab5 = st.tabs(["Repo Search", "Developer Search", "Visualizations", "Campaign", "Comparison"])
 
 with tab1:
     st.title('GitHub Repository Details')
-    repo_input = st.text_input('Enter the repository (format: owner/repo):')
-    add_to_campaign = st.button('Add to Campaign')
-
-    if st.button('Search Repo') or add_to_campaign:
+    # A form batches the input widgets so typing or toggling only triggers a
+    # rerun when one of the submit buttons is pressed
+    with st.form("repo_search"):
+        repo_input = st.text_input('Enter the repository (format: owner/repo):')
+        force_refresh = st.checkbox('Force refresh (skip cached data)')
+        search_repo = st.form_submit_button('Search Repo')
+        add_to_campaign = st.form_submit_button('Add to Campaign')
+
+    if search_repo or add_to_campaign:
         if repo_input:
+            if force_refresh:
+                get_repo_details_and_issues.clear()
             owner_repo = repo_input.split('/')
             if len(owner_repo) == 2:
                 owner, repo = owner_repo
@@ -197,10 +387,8 @@ with tab1:
                     # Extract repository details
                     stargazers_count = repo_info['data']['repository']['stargazerCount']
                     fork_count = repo_info['data']['repository']['forkCount']
-                    languages = [language['node']['name'] for language in repo_info['data']['repository']['languages']['edges']]
-
-                    # Filter out "Hack" language
-                    languages = [lang for lang in languages if lang != "Hack"]
+                    # Filter out "Hack" language in the same pass
+                    languages = [name for language in repo_info['data']['repository']['languages']['edges'] if (name := language['node']['name']) != "Hack"]
 
                     # Extract issues and calculate average resolution time
                     issues = [edge['node'] for edge in repo_info['data']['repository']['issues']['edges']]
@@ -213,18 +401,20 @@ with tab1:
                         average_time_formatted = f"{average_time:.2f} hours"
 
                     # Extract latest commit details
-                    latest_commit_edge = repo_info['data']['repository']['defaultBranchRef']['target']['history']['edges']
+                    target = repo_info['data']['repository']['defaultBranchRef']['target'] if repo_info['data']['repository']['defaultBranchRef'] else None
+                    latest_commit_edge = target['latestCommit']['edges'] if target else []
                     latest_commit = latest_commit_edge[0]['node'] if latest_commit_edge else None
+                    # Parse the commit date once; display and persistence both
+                    # format from this value
+                    committed_date = parse_github_timestamp(latest_commit['committedDate']) if latest_commit else None
 
                     # Extract contributors
                     contributors_edges = repo_info['data']['repository']['collaborators']['edges']
                     contributors = [edge['node'] for edge in contributors_edges]
 
-                    # Count issues resolved in the last 60 days
-                    issues_resolved_last_60_days = count_issues_resolved_last_60_days(issues)
-
-                    # Count commits in the last 60 days
-                    commits_last_60_days = count_commits_last_60_days(latest_commit_edge if latest_commit_edge else [])
+                    # Server-side counts for the last 60 days
+                    issues_resolved_last_60_days = repo_info['data']['repository']['recentIssues']['totalCount']
+                    commits_last_60_days = target['recentCommits']['totalCount'] if target else 0
 
                     # Display the details
                     st.write(f"**Stars:** {stargazers_count}")
@@ -234,7 +424,6 @@ with tab1:
                     st.write(f"**Issues solved in the last 60 days:** {issues_resolved_last_60_days}")
                     st.write(f"**Commits in the last 60 days:** {commits_last_60_days}")
                     if latest_commit:
-                        committed_date = datetime.strptime(latest_commit['committedDate'], '%Y-%m-%dT%H:%M:%SZ')
                         latest_commit_str = f"[{latest_commit['message']}]({latest_commit['url']}) on {committed_date.strftime('%Y-%m-%d %H:%M:%S')}"
                         st.write(f"**Latest commit:** {latest_commit_str}")
                     else:
@@ -243,7 +432,7 @@ with tab1:
                     
                     # Display contributors
                     if contributors:
-                        contributors_str = ', '.join([f"[{contributor['login']}]({contributor['url']})" for contributor in contributors])
+                        contributors_str = ', '.join(f"[{contributor['login']}]({contributor['url']})" for contributor in contributors)
                         st.write(f"**Contributors:** {contributors_str}")
                     else:
                         contributors_str = "No contributors found."
@@ -251,21 +440,20 @@ with tab1:
 
                     # Add to campaign if button is clicked
                     if add_to_campaign:
-                        campaign_repos.append({
+                        st.session_state.campaign_repos.append({
                             "repo_name": repo,
                             "owner": owner,
                             "stars": stargazers_count,
                             "forks": fork_count,
                             "languages": ', '.join(languages),
                             "average_issue_resolution_time": average_time_formatted,
-                            "latest_commit_date": committed_date.strftime('%Y-%m-%d') if latest_commit else None,
-                            "contributors": ', '.join([contributor['login'] for contributor in contributors]),
+                            "latest_commit_date": committed_date.date().isoformat() if committed_date else None,
+                            "contributors": ', '.join(contributor['login'] for contributor in contributors),
                             "issues_solved_last_60_days": issues_resolved_last_60_days,
                             "commits_last_60_days": commits_last_60_days
                         })
-                        save_campaign(campaign_repos)  # Save the campaign data
+                        save_campaign(st.session_state.campaign_repos)  # Save the campaign data
                         st.success(f"Repository {owner}/{repo} added to the campaign.")
-                        st.experimental_rerun()  # Rerun to clear the input and refresh the campaign
                 else:
                     st.error(f"Repository {owner}/{repo} not found or API response is malformed.")
             else:
@@ -276,10 +464,13 @@ with tab1:
 with tab2:
     st.title('GitHub Developer Details')
     dev_input = st.text_input('Enter the developer username:')
+    dev_force_refresh = st.checkbox('Force refresh (skip cached data)', key='dev_force_refresh')
     add_dev_to_campaign = st.button('Add Developer to Campaign')
 
     if st.button('Search Developer') or add_dev_to_campaign:
         if dev_input:
+            if dev_force_refresh:
+                get_developer_details.clear()
             dev_info, error = get_developer_details(dev_input)
 
             if error:
@@ -289,33 +480,28 @@ with tab2:
                 st.write(f"Developer profile: [**{dev_input}**]({user_url})")
                 st.write(f"Repositories contributed to by **{dev_input}**:")
                 for repo in dev_info:
-                    st.write(f"- [{repo['name']}]({repo['html_url']})")
+                    st.write(f"- [{repo['name']}]({repo['url']})")
 
-                # Count commits in the last 60 days for each repo
+                # The 60-day commit counts arrive nested in the same response
                 total_commits_last_60_days = 0
                 top_recent_repo = None
                 for repo in dev_info:
-                    repo_name = repo['name']
-                    owner = repo['owner']['login']
-                    repo_info, error = get_repo_details_and_issues(owner, repo_name)
-                    if repo_info:
-                        commits_last_60_days = count_commits_last_60_days(repo_info['data']['repository']['defaultBranchRef']['target']['history']['edges'] if repo_info['data']['repository']['defaultBranchRef'] else [])
-                        total_commits_last_60_days += commits_last_60_days
-                        if not top_recent_repo or repo['created_at'] > top_recent_repo['created_at']:
-                            top_recent_repo = repo
+                    commits_last_60_days = repo['defaultBranchRef']['target']['history']['totalCount'] if repo['defaultBranchRef'] else 0
+                    total_commits_last_60_days += commits_last_60_days
+                    if not top_recent_repo or repo['createdAt'] > top_recent_repo['createdAt']:
+                        top_recent_repo = repo
 
                 if not top_recent_repo:
                     top_recent_repo = {"name": "No recent repos found"}
 
                 if add_dev_to_campaign:
-                    dev_campaign.append({
+                    st.session_state.dev_campaign.append({
                         "github_link": user_url,
                         "total_commits_last_60_days": total_commits_last_60_days,
                         "top_recent_repo": top_recent_repo['name']
                     })
-                    save_dev_campaign(dev_campaign)  # Save the developer campaign data
+                    save_dev_campaign(st.session_state.dev_campaign)  # Save the developer campaign data
                     st.success(f"Developer {dev_input} added to the campaign.")
-                    st.experimental_rerun()  # Rerun to clear the input and refresh the campaign
 
                 st.write(f"**Total commits in the last 60 days:** {total_commits_last_60_days}")
                 st.write(f"**Top recent repo:** {top_recent_repo['name']}")
@@ -329,24 +515,17 @@ with tab3:
     st.title('Visualizations')
     st.header('Insights from 1000 Active Repositories')
 
+    df = load_repos_csv(csv_file_path)
+
     # Most Popular Programming Languages
     st.header('Most Popular Programming Languages')
-    languages = df['languages'].str.split(', ').explode().dropna()
-    lang_counts = languages.value_counts().head(10)
-
-    fig, ax = plt.subplots()
-    sns.barplot(x=lang_counts.values, y=lang_counts.index, ax=ax)
-    ax.set_title('Top 10 Most Popular Programming Languages')
-    ax.set_xlabel('Count')
-    ax.set_ylabel('Programming Language')
-    for i in range(len(lang_counts)):
-        ax.text(lang_counts.values[i], i, str(lang_counts.values[i]), color='black', ha="left")
-    st.pyplot(fig)
+    all_lang_counts = get_language_counts(df)
+    lang_counts = all_lang_counts.head(10)
+
+    st.bar_chart(lang_counts)
 
     # All Identified Programming Languages with Counts
     st.header('All Identified Programming Languages with Counts')
-    all_lang_counts = languages.value_counts()
-
     st.write("All programming language counts:")
     st.write(all_lang_counts)
 
@@ -358,42 +537,21 @@ with tab3:
 
     # Fastest Issue Resolution Time
     st.header('Fastest Issue Resolution Time')
-    fastest_resolution_times = df[(df['resolution_time_hours'].notnull()) & (df['resolution_time_hours'] > 0)].sort_values(by='resolution_time_hours').head(10)
+    fastest_resolution_times = top_n(df[df['resolution_time_hours'] > 0], 'resolution_time_hours', ascending=True)
 
-    fig, ax = plt.subplots()
-    sns.barplot(x=fastest_resolution_times['resolution_time_hours'].round(0), y=fastest_resolution_times['repo_name'], ax=ax)
-    ax.set_title('Top 10 Repositories by Fastest Issue Resolution Time')
-    ax.set_xlabel('Resolution Time (hours)')
-    ax.set_ylabel('Repository')
-    for i in range(len(fastest_resolution_times)):
-        ax.text(fastest_resolution_times['resolution_time_hours'].values[i].round(0), i, str(fastest_resolution_times['resolution_time_hours'].values[i].round(0)), color='black', ha="left")
-    st.pyplot(fig)
+    st.bar_chart(fastest_resolution_times.set_index('repo_name')['resolution_time_hours'].round(0))
 
     # Community Engagement: Stars
     st.header('Community Engagement: Stars')
-    top_stars_repos = df.sort_values(by='stars_count', ascending=False).head(10)
+    top_stars_repos = top_n(df, 'stars_count')
 
-    fig, ax = plt.subplots()
-    sns.barplot(x=top_stars_repos['stars_count'], y=top_stars_repos['repo_name'], ax=ax)
-    ax.set_title('Top 10 Repositories by Stars')
-    ax.set_xlabel('Stars')
-    ax.set_ylabel('Repository')
-    for i in range(len(top_stars_repos)):
-        ax.text(top_stars_repos['stars_count'].values[i], i, str(top_stars_repos['stars_count'].values[i]), color='black', ha="left")
-    st.pyplot(fig)
+    st.bar_chart(top_stars_repos.set_index('repo_name')['stars_count'])
 
     # Community Engagement: Forks
     st.header('Community Engagement: Forks')
-    top_forks_repos = df.sort_values(by='forks_count', ascending=False).head(10)
+    top_forks_repos = top_n(df, 'forks_count')
 
-    fig, ax = plt.subplots()
-    sns.barplot(x=top_forks_repos['forks_count'], y=top_forks_repos['repo_name'], ax=ax)
-    ax.set_title('Top 10 Repositories by Forks')
-    ax.set_xlabel('Forks')
-    ax.set_ylabel('Repository')
-    for i in range(len(top_forks_repos)):
-        ax.text(top_forks_repos['forks_count'].values[i], i, str(top_forks_repos['forks_count'].values[i]), color='black', ha="left")
-    st.pyplot(fig)
+    st.bar_chart(top_forks_repos.set_index('repo_name')['forks_count'])
 
 with tab4:
     st.title('Campaign')
@@ -401,18 +559,34 @@ with tab4:
 
     if campaign_type == 'Repository':
         if st.button('Clear Campaign'):
-            campaign_repos.clear()
-            save_campaign(campaign_repos)  # Clear the campaign data file
-            st.experimental_rerun()
-
-        if campaign_repos:
-            st.write(f"**Total Repositories in Campaign:** {len(campaign_repos)}")
-            campaign_df = pd.DataFrame(campaign_repos)
+            st.session_state.campaign_repos.clear()
+            save_campaign(st.session_state.campaign_repos)  # Clear the campaign data file
+
+        if st.session_state.campaign_repos:
+            # Refresh every campaign repo with batched GraphQL queries
+            if st.button('Refresh Campaign Data'):
+                pairs = [(repo['owner'], repo['repo_name']) for repo in st.session_state.campaign_repos]
+                results, error = get_many_repos(pairs)
+                if error:
+                    st.error(error)
+                else:
+                    refreshed = []
+                    for repo in st.session_state.campaign_repos:
+                        repository = results.get((repo['owner'], repo['repo_name']))
+                        if repository:
+                            refreshed.append(build_campaign_entry(repo['owner'], repo['repo_name'], repository))
+                        else:
+                            refreshed.append(repo)
+                    st.session_state.campaign_repos[:] = refreshed
+                    save_campaign(st.session_state.campaign_repos)
+
+            st.write(f"**Total Repositories in Campaign:** {len(st.session_state.campaign_repos)}")
+            campaign_df = pd.DataFrame(st.session_state.campaign_repos)
 
             # Download CSV button
             st.download_button(
                 label="Download Campaign Data as CSV",
-                data=campaign_df.to_csv(index=False).encode('utf-8'),
+                data=campaign_csv_bytes(tuple(tuple(row.items()) for row in st.session_state.campaign_repos)),
                 file_name='campaign_data.csv',
                 mime='text/csv'
             )
@@ -423,18 +597,17 @@ with tab4:
             st.write("No repositories in the campaign. Add repositories from the Repo Search tab.")
     else:
         if st.button('Clear Developer Campaign'):
-            dev_campaign.clear()
-            save_dev_campaign(dev_campaign)  # Clear the developer campaign data file
-            st.experimental_rerun()
+            st.session_state.dev_campaign.clear()
+            save_dev_campaign(st.session_state.dev_campaign)  # Clear the developer campaign data file
 
-        if dev_campaign:
-            st.write(f"**Total Developers in Campaign:** {len(dev_campaign)}")
-            dev_campaign_df = pd.DataFrame(dev_campaign)
+        if st.session_state.dev_campaign:
+            st.write(f"**Total Developers in Campaign:** {len(st.session_state.dev_campaign)}")
+            dev_campaign_df = pd.DataFrame(st.session_state.dev_campaign)
 
             # Download CSV button
             st.download_button(
                 label="Download Developer Campaign Data as CSV",
-                data=dev_campaign_df.to_csv(index=False).encode('utf-8'),
+                data=campaign_csv_bytes(tuple(tuple(row.items()) for row in st.session_state.dev_campaign)),
                 file_name='dev_campaign_data.csv',
                 mime='text/csv'
             )
@@ -450,13 +623,16 @@ with tab5:
     campaign_type = st.selectbox('Select Comparison Type', ['Repository', 'Developer'])
 
     if campaign_type == 'Repository':
-        if len(campaign_repos) >= 2:
-            repo_options = [f"{repo['owner']}/{repo['repo_name']}" for repo in campaign_repos]
+        if len(st.session_state.campaign_repos) >= 2:
+            # Index the campaign once so the per-checkbox reruns do O(1)
+            # lookups instead of scanning the list for each selection
+            campaign_by_key = {f"{repo['owner']}/{repo['repo_name']}": repo for repo in st.session_state.campaign_repos}
+            repo_options = list(campaign_by_key)
             repo1, repo2 = st.selectbox('Select first repository to compare', repo_options), st.selectbox('Select second repository to compare', repo_options, index=1)
 
             if repo1 and repo2:
-                repo1_data = next(repo for repo in campaign_repos if f"{repo['owner']}/{repo['repo_name']}" == repo1)
-                repo2_data = next(repo for repo in campaign_repos if f"{repo['owner']}/{repo['repo_name']}" == repo2)
+                repo1_data = campaign_by_key[repo1]
+                repo2_data = campaign_by_key[repo2]
 
                 st.write(f"## Comparison between {repo1} and {repo2}")
 
@@ -504,13 +680,14 @@ with tab5:
         else:
             st.write("Add at least two repositories to the campaign for comparison.")
     else:
-        if len(dev_campaign) >= 2:
-            dev_options = [f"{dev['github_link']}" for dev in dev_campaign]
+        if len(st.session_state.dev_campaign) >= 2:
+            dev_by_key = {dev['github_link']: dev for dev in st.session_state.dev_campaign}
+            dev_options = list(dev_by_key)
             dev1, dev2 = st.selectbox('Select first developer to compare', dev_options), st.selectbox('Select second developer to compare', dev_options, index=1)
 
             if dev1 and dev2:
-                dev1_data = next(dev for dev in dev_campaign if dev['github_link'] == dev1)
-                dev2_data = next(dev for dev in dev_campaign if dev['github_link'] == dev2)
+                dev1_data = dev_by_key[dev1]
+                dev2_data = dev_by_key[dev2]
 
                 st.write(f"## Comparison between {dev1} and {dev2}")
 